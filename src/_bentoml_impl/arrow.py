@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing as t
 
 import pyarrow as pa
@@ -12,7 +13,11 @@ SchemaDict: t.TypeAlias = t.Dict[str, t.Any]
 T = t.TypeVar("T", bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=1024)
 def model_to_arrow_schema(model: type[BaseModel]) -> pa.Schema:
+    # Generating the JSON schema is far more expensive than the arrow conversion
+    # itself, and both only depend on the model class. pa.Schema is immutable, so
+    # the result can be shared by every call.
     schema = model.model_json_schema(mode="serialization")
     fields = _model_to_fields(schema, ref_defs=schema.get("$defs", {}))
     return pa.schema(fields)
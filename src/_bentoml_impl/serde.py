@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import io
 import json
 import logging
@@ -20,11 +21,23 @@ from _bentoml_sdk.typing_utils import is_list_type
 from _bentoml_sdk.typing_utils import is_union_type
 from _bentoml_sdk.validators import DataframeSchema
 from _bentoml_sdk.validators import TensorSchema
+from bentoml._internal.utils import fastjson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 if t.TYPE_CHECKING:
+    import numpy as np
     from starlette.requests import Request
 
     from _bentoml_sdk import IODescriptor
+    from _bentoml_sdk.validators import TensorFormat
+else:
+    from bentoml._internal.utils.lazy_loader import LazyLoader
+
+    np = LazyLoader("np", globals(), "numpy")
 
 
 T = t.TypeVar("T", bound="IODescriptor")
@@ -75,17 +88,38 @@ class Serde(abc.ABC):
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_tensor_schema(
+    format: TensorFormat, dtype: str | None, shape: tuple[int, ...] | None
+) -> TensorSchema:
+    return TensorSchema(format=format, dtype=dtype, shape=shape)
+
+
+def _tensor_schema(schema: dict[str, t.Any]) -> TensorSchema:
+    # TensorSchema resolves its dtype and validator once, share it across values
+    shape = schema.get("shape")
+    return _cached_tensor_schema(
+        schema.get("format", ""),
+        schema.get("dtype"),
+        None if shape is None else tuple(shape),
+    )
+
+
 class GenericSerde:
+    # Whether serialize_value() can serialize numpy arrays by itself
+    serializes_numpy: bool = False
+
     def _encode(self, obj: t.Any, schema: dict[str, t.Any]) -> t.Any:
         mode = "json" if isinstance(self, JSONSerde) else "python"
         info = SerializationInfo(mode=mode)
         if schema.get("type") == "tensor":
-            child_schema = TensorSchema(
-                format=schema.get("format", ""),
-                dtype=schema.get("dtype"),
-                shape=schema.get("shape"),
-            )
-            return child_schema.encode(child_schema.validate(obj), info)
+            child_schema = _tensor_schema(schema)
+            obj = child_schema.validate(obj)
+            if self.serializes_numpy:
+                arr = child_schema.to_numpy(obj)
+                if _is_json_safe_array(arr):
+                    return arr
+            return child_schema.encode(obj, info)
         if schema.get("type") == "dataframe":
             child_schema = DataframeSchema(
                 orient=schema.get("orient", "records"), columns=schema.get("columns")
@@ -105,11 +139,7 @@ class GenericSerde:
 
     def _decode(self, obj: t.Any, schema: dict[str, t.Any]) -> t.Any:
         if schema.get("type") == "tensor":
-            child_schema = TensorSchema(
-                format=schema.get("format", ""),
-                dtype=schema.get("dtype"),
-                shape=schema.get("shape"),
-            )
+            child_schema = _tensor_schema(schema)
             return child_schema.validate(obj)
         if schema.get("type") == "dataframe":
             child_schema = DataframeSchema(
@@ -143,8 +173,27 @@ class GenericSerde:
         raise NotImplementedError
 
 
+def _is_json_safe_array(arr: np.ndarray[t.Any, t.Any]) -> bool:
+    """Whether orjson writes the array exactly like json.dumps(arr.tolist()) does."""
+    # orjson copies the raw buffer, it doesn't handle other byte orders or strides
+    if not (arr.dtype.isnative and arr.flags.c_contiguous):
+        return False
+    if arr.dtype.kind in "biu":
+        return True
+    # orjson writes NaN and Infinity as null, json keeps them
+    return arr.dtype.kind == "f" and bool(np.isfinite(arr).all())
+
+
+def _json_default(obj: t.Any) -> t.Any:
+    # numpy arrays that the encoder can't serialize natively, e.g. non-contiguous ones
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class JSONSerde(GenericSerde, Serde):
     media_type = "application/json"
+    serializes_numpy = orjson is not None
 
     def serialize_model(self, model: IODescriptor) -> Payload:
         return Payload(
@@ -159,10 +208,10 @@ class JSONSerde(GenericSerde, Serde):
         return cls.model_validate_json(b"".join(payload.data) or b"{}")
 
     def serialize_value(self, obj: t.Any) -> Payload:
-        return Payload((json.dumps(obj).encode("utf-8"),))
+        return Payload((fastjson.dumps(obj, default=_json_default),))
 
     def deserialize_value(self, payload: Payload) -> t.Any:
-        return json.loads(b"".join(payload.data) or b"{}")
+        return fastjson.loads(b"".join(payload.data) or b"{}")
 
 
 class MultipartSerde(JSONSerde):
@@ -203,7 +252,7 @@ class MultipartSerde(JSONSerde):
             else:
                 assert isinstance(v := form[k], str)
                 try:
-                    data[k] = json.loads(v)
+                    data[k] = fastjson.loads(v)
                 except json.JSONDecodeError:
                     data[k] = v
         return cls.model_validate(data)
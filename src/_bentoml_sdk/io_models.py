@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import inspect
 import io
-import json
 import logging
 import pathlib
 import sys
@@ -18,6 +17,7 @@ from starlette.responses import Response
 from typing_extensions import get_args
 
 from bentoml._internal.service.openapi.specification import Schema
+from bentoml._internal.utils import fastjson
 
 from .typing_utils import is_image_type
 from .typing_utils import is_iterator_type
@@ -425,7 +425,7 @@ class IORootModel(IODescriptor, t.Generic[RootModelRootType]):
         return super().model_dump(**kwargs)["root"]
 
     def model_dump_json(self, **kwargs: t.Any) -> str:
-        return json.dumps(self.model_dump(mode="json", **kwargs))
+        return fastjson.dumps(self.model_dump(mode="json", **kwargs)).decode("utf-8")
 
     @classmethod
     def model_validate(cls, obj: t.Any, **kwargs: t.Any) -> t.Self:
@@ -435,7 +435,7 @@ class IORootModel(IODescriptor, t.Generic[RootModelRootType]):
     def model_validate_json(
         cls, json_data: str | bytes | bytearray, **kwargs: t.Any
     ) -> t.Self:
-        return cls.model_validate(json.loads(json_data), **kwargs)
+        return cls.model_validate(fastjson.loads(json_data), **kwargs)
 
     @classmethod
     def model_json_schema(cls, *args: t.Any, **kwargs: t.Any) -> dict[str, t.Any]:
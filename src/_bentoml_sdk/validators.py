@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import contextlib
+import contextvars
 import fnmatch
 import functools
 import io
-import operator
+import math
 import os
+import shutil
 import tempfile
+import types
 import typing as t
 from pathlib import Path
 from pathlib import PurePath
@@ -17,6 +20,7 @@ from pydantic_core import core_schema
 from starlette.datastructures import UploadFile
 
 from bentoml._internal.utils import dict_filter_none
+from bentoml.exceptions import MissingDependencyException
 
 from .typing_utils import is_file_like
 from .typing_utils import is_image_type
@@ -24,6 +28,7 @@ from .typing_utils import is_image_type
 if t.TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import pyarrow as pa
     import tensorflow as tf
     import torch
     from pydantic import GetCoreSchemaHandler
@@ -45,18 +50,20 @@ else:
 
 T = t.TypeVar("T")
 
-# This is an internal global state that is True when the model is being serialized for arrow
-__in_arrow_serialization__ = False
+# True when the model is being serialized for arrow. A context variable rather than
+# a module global so that concurrent serializations don't observe each other's mode.
+_ARROW_MODE: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_ARROW_MODE", default=False
+)
 
 
 @contextlib.contextmanager
-def arrow_serialization():
-    global __in_arrow_serialization__
-    __in_arrow_serialization__ = True
+def arrow_serialization() -> t.Generator[None, None, None]:
+    token = _ARROW_MODE.set(True)
     try:
         yield
     finally:
-        __in_arrow_serialization__ = False
+        _ARROW_MODE.reset(token)
 
 
 class PILImageEncoder:
@@ -132,20 +139,21 @@ class FileSchema:
             return obj
         if isinstance(obj, PurePath):
             return Path(obj)
-        if isinstance(obj, UploadFile):
-            body = obj.file.read()
+        body: bytes | t.BinaryIO
+        if isinstance(obj, bytes):
+            body = obj
+            filename = None
+        elif isinstance(obj, UploadFile):
+            body = obj.file
             filename = obj.filename
             media_type = obj.content_type
         elif is_file_like(obj):
-            body = obj.read()
+            body = obj
             filename = (
                 os.path.basename(fn)
                 if (fn := getattr(obj, "name", None)) is not None
                 else None
             )
-        elif isinstance(obj, bytes):
-            body = obj
-            filename = None
         else:
             from pydantic_core import PydanticCustomError
 
@@ -158,7 +166,11 @@ class FileSchema:
         with tempfile.NamedTemporaryFile(
             suffix=filename, dir=request_temp_dir(), delete=False
         ) as f:
-            f.write(body)
+            if isinstance(body, bytes):
+                f.write(body)
+            else:
+                # copy in chunks rather than reading the whole upload into memory
+                shutil.copyfileobj(body, f)
             return Path(f.name)
 
     def __get_pydantic_core_schema__(
@@ -171,17 +183,88 @@ class FileSchema:
         )
 
 
+# The JSON schema extensions below are pure functions of the (immutable) schema fields.
+# They are shared between calls, so they are exposed as read-only mappings.
+@functools.lru_cache(maxsize=None)
+def _tensor_json_schema(
+    format: TensorFormat,
+    dtype: str | None,
+    shape: tuple[int, ...] | None,
+    dim: int | None,
+) -> t.Mapping[str, t.Any]:
+    return types.MappingProxyType(
+        dict_filter_none(
+            {
+                "type": "tensor",
+                "format": format,
+                "dtype": dtype,
+                "shape": shape,
+                "dim": dim,
+            }
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _dataframe_json_schema(
+    orient: str, columns: tuple[str, ...] | None
+) -> t.Mapping[str, t.Any]:
+    return types.MappingProxyType(
+        dict_filter_none({"type": "dataframe", "orient": orient, "columns": columns})
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _framework_dtype(format: TensorFormat, dtype: str | None) -> t.Any:
+    if dtype is None:
+        return None
+    if format == "numpy-array":
+        return getattr(np, dtype)
+    elif format == "tf-tensor":
+        return getattr(tf, dtype)
+    else:
+        return getattr(torch, dtype)
+
+
+def _torch_to_numpy(arr: torch.Tensor) -> np.ndarray[t.Any, t.Any]:
+    # detach() is free and avoids numpy() failing on tensors that require grad
+    arr = arr.detach()
+    if arr.device.type != "cpu":
+        # copy at the original width, any widening below happens on the host
+        arr = arr.cpu()
+    if arr.dtype == torch.bfloat16:
+        # numpy has no bfloat16, float32 represents it exactly
+        arr = arr.float()
+    return arr.numpy()
+
+
 @attrs.frozen(unsafe_hash=True)
 class TensorSchema:
     format: TensorFormat
     dtype: t.Optional[str] = None
-    shape: t.Optional[t.Tuple[int, ...]] = None
+    shape: t.Optional[t.Tuple[int, ...]] = attrs.field(
+        default=None,
+        converter=lambda x: None if x is None else tuple(x),
+    )
+    # Picked once per schema instead of branching on format for every value
+    _to_numpy_fn: t.Callable[[t.Any, bool], np.ndarray[t.Any, t.Any]] = attrs.field(
+        init=False, repr=False, eq=False, hash=False
+    )
+    _validate_fn: t.Callable[[t.Any], t.Any] = attrs.field(
+        init=False, repr=False, eq=False, hash=False
+    )
+
+    def __attrs_post_init__(self) -> None:
+        try:
+            to_numpy, make_validator = _TENSOR_FORMATS[self.format]
+        except KeyError:
+            raise ValueError(f"Unsupported tensor format: {self.format!r}") from None
+        object.__setattr__(self, "_to_numpy_fn", to_numpy)
+        object.__setattr__(self, "_validate_fn", make_validator(self.dtype, self.shape))
 
     @property
     def dim(self) -> int | None:
-        if self.shape is None:
-            return None
-        return functools.reduce(operator.mul, self.shape, 1)
+        return None if self.shape is None else math.prod(self.shape)
 
     def __get_pydantic_json_schema__(
         self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
@@ -189,15 +272,7 @@ class TensorSchema:
         value = handler(schema)
         if handler.mode == "validation":
             value.update(
-                dict_filter_none(
-                    {
-                        "type": "tensor",
-                        "format": self.format,
-                        "dtype": self.dtype,
-                        "shape": self.shape,
-                        "dim": self.dim,
-                    }
-                )
+                _tensor_json_schema(self.format, self.dtype, self.shape, self.dim)
             )
         else:
             dimension = 1 if self.shape is None else len(self.shape)
@@ -211,7 +286,7 @@ class TensorSchema:
         self, source_type: t.Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         return core_schema.no_info_after_validator_function(
-            self.validate,
+            self._validate_fn,
             core_schema.any_schema(),
             serialization=core_schema.plain_serializer_function_ser_schema(
                 self.encode, info_arg=True
@@ -219,60 +294,131 @@ class TensorSchema:
         )
 
     def encode(self, arr: TensorType, info: core_schema.SerializationInfo) -> t.Any:
-        if self.format == "numpy-array":
-            assert isinstance(arr, np.ndarray)
-            numpy_array = arr
-        elif self.format == "tf-tensor":
-            if not info.mode_is_json():  # tf.Tensor supports picklev5 serialization
-                return arr
-            numpy_array = arr.numpy()
-        else:
-            assert isinstance(arr, torch.Tensor)
-            if arr.device.type != "cpu":
-                numpy_array = arr.cpu().numpy()
-            else:
-                numpy_array = arr.numpy()
-        if __in_arrow_serialization__:
-            numpy_array = numpy_array.flatten()
+        if self.format == "tf-tensor" and not info.mode_is_json():
+            return arr  # tf.Tensor supports picklev5 serialization
+        numpy_array = self.to_numpy(arr)
         if info.mode_is_json():
+            # pydantic-core can only serialize python objects, and tolist() is the
+            # cheapest way to produce them. Serializers that understand numpy arrays
+            # should call to_numpy() instead.
             return numpy_array.tolist()
         return numpy_array
 
+    def to_numpy(self, arr: TensorType) -> np.ndarray[t.Any, t.Any]:
+        """Convert a tensor of this schema to a numpy array without boxing its elements."""
+        return self._to_numpy_fn(arr, _ARROW_MODE.get())
+
     @property
     def framework_dtype(self) -> t.Any:
-        dtype = self.dtype
-        if dtype is None:
-            return None
-        if self.format == "numpy-array":
-            return getattr(np, dtype)
-        elif self.format == "tf-tensor":
-            return getattr(tf, dtype)
-        else:
-            return getattr(torch, dtype)
+        return _framework_dtype(self.format, self.dtype)
 
     def validate(self, obj: t.Any) -> t.Any:
-        arr: t.Any
-        if self.format == "numpy-array":
-            if isinstance(obj, np.ndarray):
-                return obj
-            arr = np.array(obj, dtype=self.framework_dtype)
-            if self.shape is not None:
-                arr = arr.reshape(self.shape)
-            return arr
-        elif self.format == "tf-tensor":
-            if isinstance(obj, tf.Tensor):
-                return obj
-            else:
-                return tf.constant(obj, dtype=self.framework_dtype, shape=self.shape)  # type: ignore
-        else:
-            if isinstance(obj, torch.Tensor):
-                return obj
-            if isinstance(obj, np.ndarray):
-                return torch.from_numpy(obj)
-            arr = torch.tensor(obj, dtype=self.framework_dtype)
-            if self.shape is not None:
-                arr = arr.reshape(self.shape)
-            return arr
+        return self._validate_fn(obj)
+
+
+# Arrow wants flat arrays. Tensors are flattened before leaving the device so that
+# only a contiguous 1-D buffer is copied to the host, and never copied when the data
+# is already contiguous.
+def _numpy_array_to_numpy(
+    arr: np.ndarray[t.Any, t.Any], flatten: bool
+) -> np.ndarray[t.Any, t.Any]:
+    assert isinstance(arr, np.ndarray)
+    return np.ravel(arr) if flatten else arr
+
+
+def _tf_tensor_to_numpy(arr: tf.Tensor, flatten: bool) -> np.ndarray[t.Any, t.Any]:
+    return (tf.reshape(arr, [-1]) if flatten else arr).numpy()
+
+
+def _torch_tensor_to_numpy(
+    arr: torch.Tensor, flatten: bool
+) -> np.ndarray[t.Any, t.Any]:
+    assert isinstance(arr, torch.Tensor)
+    return _torch_to_numpy(arr.reshape(-1) if flatten else arr)
+
+
+# The validators are module-level functions bound with functools.partial rather than
+# closures, so that TensorSchema instances stay picklable.
+def _validate_numpy_array(dtype: np.dtype[t.Any] | None, obj: t.Any) -> t.Any:
+    if isinstance(obj, np.ndarray):
+        return obj
+    return np.array(obj, dtype=dtype)
+
+
+def _validate_numpy_array_with_shape(
+    dtype: np.dtype[t.Any] | None, shape: tuple[int, ...], obj: t.Any
+) -> t.Any:
+    if isinstance(obj, np.ndarray):
+        return obj
+    return np.array(obj, dtype=dtype).reshape(shape)
+
+
+def _make_numpy_array_validator(
+    dtype: str | None, shape: tuple[int, ...] | None
+) -> t.Callable[[t.Any], t.Any]:
+    # Resolved once here: np.array() converts a dtype instance faster than a
+    # scalar type, which matters for the many small arrays of batched services.
+    np_dtype = (
+        None if dtype is None else np.dtype(_framework_dtype("numpy-array", dtype))
+    )
+    if shape is None:
+        return functools.partial(_validate_numpy_array, np_dtype)
+    return functools.partial(_validate_numpy_array_with_shape, np_dtype, shape)
+
+
+def _validate_tf_tensor(
+    dtype: tf.DType | None, shape: tuple[int, ...] | None, obj: t.Any
+) -> t.Any:
+    if isinstance(obj, tf.Tensor):
+        return obj
+    return tf.constant(obj, dtype=dtype, shape=shape)  # type: ignore
+
+
+def _make_tf_tensor_validator(
+    dtype: str | None, shape: tuple[int, ...] | None
+) -> t.Callable[[t.Any], t.Any]:
+    tf_dtype = _framework_dtype("tf-tensor", dtype)
+    return functools.partial(_validate_tf_tensor, tf_dtype, shape)
+
+
+def _validate_torch_tensor(dtype: torch.dtype | None, obj: t.Any) -> t.Any:
+    if isinstance(obj, torch.Tensor):
+        return obj
+    if isinstance(obj, np.ndarray):
+        return torch.from_numpy(obj)
+    return torch.tensor(obj, dtype=dtype)
+
+
+def _validate_torch_tensor_with_shape(
+    dtype: torch.dtype | None, shape: tuple[int, ...], obj: t.Any
+) -> t.Any:
+    if isinstance(obj, torch.Tensor):
+        return obj
+    if isinstance(obj, np.ndarray):
+        return torch.from_numpy(obj)
+    return torch.tensor(obj, dtype=dtype).reshape(shape)
+
+
+def _make_torch_tensor_validator(
+    dtype: str | None, shape: tuple[int, ...] | None
+) -> t.Callable[[t.Any], t.Any]:
+    torch_dtype = _framework_dtype("torch-tensor", dtype)
+    if shape is None:
+        return functools.partial(_validate_torch_tensor, torch_dtype)
+    return functools.partial(_validate_torch_tensor_with_shape, torch_dtype, shape)
+
+
+_TENSOR_FORMATS: dict[
+    str,
+    tuple[
+        t.Callable[[t.Any, bool], np.ndarray[t.Any, t.Any]],
+        t.Callable[[str | None, tuple[int, ...] | None], t.Callable[[t.Any], t.Any]],
+    ],
+] = {
+    "numpy-array": (_numpy_array_to_numpy, _make_numpy_array_validator),
+    "tf-tensor": (_tf_tensor_to_numpy, _make_tf_tensor_validator),
+    "torch-tensor": (_torch_tensor_to_numpy, _make_torch_tensor_validator),
+}
 
 
 @attrs.frozen(unsafe_hash=True)
@@ -288,15 +434,7 @@ class DataframeSchema:
     ) -> dict[str, t.Any]:
         value = handler(schema)
         if handler.mode == "validation":
-            value.update(
-                dict_filter_none(
-                    {
-                        "type": "dataframe",
-                        "orient": self.orient,
-                        "columns": self.columns,
-                    }
-                )
-            )
+            value.update(_dataframe_json_schema(self.orient, self.columns))
         else:
             if self.orient == "records":
                 value.update(
@@ -332,17 +470,89 @@ class DataframeSchema:
     def encode(self, df: pd.DataFrame, info: core_schema.SerializationInfo) -> t.Any:
         if not info.mode_is_json():
             return df
+        if self.orient not in ("records", "columns"):
+            raise ValueError("Only 'records' and 'columns' are supported for orient")
+        if all(isinstance(c, str) for c in df.columns):
+            # arrow does the conversion in C++ instead of boxing cell by cell
+            table = _to_flat_arrow_table(
+                lambda: pa.Table.from_pandas(df, preserve_index=False)
+            )
+            if table is not None and _has_pandas_python_values(table):
+                if self.orient == "records":
+                    return table.to_pylist()
+                return table.to_pydict()
         if self.orient == "records":
             return df.to_dict(orient="records")
-        elif self.orient == "columns":
-            return df.to_dict(orient="list")
-        else:
-            raise ValueError("Only 'records' and 'columns' are supported for orient")
+        return df.to_dict(orient="list")
 
     def validate(self, obj: t.Any) -> pd.DataFrame:
         if isinstance(obj, pd.DataFrame):
             return obj
-        return pd.DataFrame(obj, columns=self.columns)
+        table = None
+        if isinstance(obj, t.Mapping) and all(
+            isinstance(v, (list, tuple, np.ndarray)) for v in obj.values()
+        ):
+            # other values, e.g. the {index: value} mappings of DataFrame.to_dict(),
+            # are left to pandas, arrow would take them as sequences of their keys
+            table = _to_flat_arrow_table(lambda: pa.Table.from_pydict(obj))
+        elif isinstance(obj, list) and obj and isinstance(obj[0], t.Mapping):
+            # pa.array() collects the keys of all rows, unlike pa.Table.from_pylist()
+            table = _to_flat_arrow_table(
+                lambda: pa.Table.from_struct_array(pa.array(obj))
+            )
+        if table is None:
+            return pd.DataFrame(obj, columns=self.columns)
+        df = table.to_pandas(self_destruct=True)
+        if self.columns is not None:
+            df = df.reindex(columns=list(self.columns))
+        return df
+
+
+def _to_flat_arrow_table(factory: t.Callable[[], pa.Table]) -> pa.Table | None:
+    """
+    Build an arrow table for fast conversion between pandas and python objects.
+
+    Returns ``None`` if pyarrow is not available, the data can't be represented in
+    arrow, or it has columns whose python representation would differ from the one
+    pandas produces: nested columns, and extension columns such as pandas periods
+    and intervals, which arrow converts to their storage values. Callers should then
+    fall back to pandas.
+    """
+    try:
+        table = factory()
+    except MissingDependencyException:
+        return None
+    except (ValueError, TypeError, OverflowError, pa.ArrowException):
+        # e.g. integers that don't fit in 64 bits, or unsupported pandas dtypes
+        return None
+    if any(
+        isinstance(field.type, pa.ExtensionType) or pa.types.is_nested(field.type)
+        for field in table.schema
+    ):
+        return None
+    return table
+
+
+def _has_pandas_python_values(table: pa.Table) -> bool:
+    """
+    Whether converting ``table`` to python objects gives the same values as pandas.
+
+    Arrow turns NaN into null and timestamps into ``datetime.datetime``, so only
+    numbers, booleans and strings without missing values qualify.
+    """
+    for field, column in zip(table.schema, table.columns):
+        if column.null_count:
+            return False
+        typ = field.type
+        if not (
+            pa.types.is_integer(typ)
+            or pa.types.is_floating(typ)
+            or pa.types.is_boolean(typ)
+            or pa.types.is_string(typ)
+            or pa.types.is_large_string(typ)
+        ):
+            return False
+    return True
 
 
 @attrs.frozen
@@ -3,13 +3,21 @@ from __future__ import annotations
 import io
 import logging
 import os
+import stat
+import sys
 import typing as t
 from functools import lru_cache
+from tempfile import SpooledTemporaryFile
 
+from multipart.multipart import MultipartParseError
 from multipart.multipart import parse_options_header
+from starlette.concurrency import iterate_in_threadpool
+from starlette.datastructures import FormData
+from starlette.datastructures import Headers
 from starlette.datastructures import UploadFile
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.responses import StreamingResponse
 
 from ...exceptions import BadInput
 from ...exceptions import BentoMLException
@@ -20,12 +28,19 @@ from ..service.openapi.specification import MediaType
 from ..service.openapi.specification import Schema
 from ..types import FileLike
 from ..utils import resolve_user_filepath
+from ..utils.formparser import MultiPartException
+from ..utils.formparser import iter_multipart_files
+from ..utils.formparser import write_spooled
 from ..utils.http import set_cookies
 from .base import IODescriptor
 
 logger = logging.getLogger(__name__)
 
 if t.TYPE_CHECKING:
+    from starlette.types import Receive
+    from starlette.types import Scope
+    from starlette.types import Send
+
     from bentoml.grpc.v1 import service_pb2 as pb
     from bentoml.grpc.v1alpha1 import service_pb2 as pb_v1alpha1
 
@@ -39,6 +54,138 @@ else:
 
 FileType = t.Union[io.IOBase, t.IO[bytes], FileLike[bytes]]
 
+# Request bodies larger than this are spooled to disk instead of being kept in memory.
+MAX_SPOOL_SIZE = 1024 * 1024
+
+
+async def _spool_request_body(request: Request) -> SpooledTemporaryFile[bytes]:
+    spool = SpooledTemporaryFile(max_size=MAX_SPOOL_SIZE)
+    async for chunk in request.stream():
+        await write_spooled(spool, chunk)
+    spool.seek(0)
+    return spool
+
+
+async def _iter_form_files(
+    form: FormData, accept: t.Callable[[Headers], bool]
+) -> t.AsyncGenerator[UploadFile, None]:
+    for val in form.values():
+        if isinstance(val, UploadFile) and accept(val.headers):
+            yield val
+
+
+def _read_all(obj: FileType) -> bytes:
+    """
+    Read the rest of ``obj``. If the remaining size can be determined up front, the
+    result is allocated once at its final size instead of being grown while reading.
+    """
+    try:
+        pos = obj.tell()
+        obj.seek(0, io.SEEK_END)
+        size = obj.tell() - pos
+        obj.seek(pos)
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is a subclass of both OSError and ValueError
+        return obj.read()
+    body = obj.read(size)
+    if len(body) < size:
+        # short read from an unbuffered stream
+        body += obj.read()
+    return body
+
+
+def _regular_file_size(obj: FileType) -> int | None:
+    """
+    Return the number of bytes left in ``obj`` if it is backed by a regular file on disk,
+    otherwise ``None`` (e.g. for in-memory streams such as :obj:`io.BytesIO`).
+    """
+    wrapped = getattr(obj, "_wrapped", obj)
+    if isinstance(wrapped, SpooledTemporaryFile) and not wrapped._rolled:  # type: ignore (private SpooledTemporaryFile attribute)
+        # fileno() would force an in-memory spool to roll over to disk
+        return None
+    try:
+        fd = obj.fileno()
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return max(st.st_size - obj.tell(), 0)
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is a subclass of both OSError and ValueError
+        return None
+
+
+class FileDescriptorResponse(StreamingResponse):
+    """
+    Response that sends a file backed by a real file descriptor without reading it
+    into memory first.
+
+    If the ASGI server supports the ``http.response.zerocopysend`` extension, the file
+    is handed over to the server so that it can use ``sendfile(2)``. Otherwise the file
+    is streamed in chunks read from a threadpool.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        file: FileType,
+        size: int,
+        status_code: int = 200,
+        headers: t.Mapping[str, str] | None = None,
+        media_type: str | None = None,
+    ) -> None:
+        self.file = file
+        self.size = size
+        super().__init__(
+            iterate_in_threadpool(iter(lambda: file.read(self.chunk_size), b"")),
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+        )
+        self.headers.setdefault("content-length", str(size))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if "http.response.zerocopysend" not in scope.get("extensions", {}):
+            return await super().__call__(scope, receive, send)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        await send(
+            {
+                "type": "http.response.zerocopysend",
+                "file": self.file,
+                "offset": self.file.tell(),
+                "count": self.size,
+            }
+        )
+        if self.background is not None:
+            await self.background()
+
+
+def _parse_content_type(header: str) -> bytes:
+    # Parameters such as the multipart boundary differ between requests, so only
+    # the media type is used as the cache key
+    return _parse_media_type(header.partition(";")[0])
+
+
+@lru_cache(maxsize=1024)
+def _parse_media_type(media_type: str) -> bytes:
+    # The same few media types are seen over and over again by a server
+    content_type, _ = parse_options_header(media_type)
+    # media types are case-insensitive, compared lowercased like _encode_mime_type
+    return content_type.lower()
+
+
+_KIND_TO_CLS: dict[str, type[File]] = {}
+
+
+def _encode_mime_type(mime_type: str | None) -> bytes | None:
+    return None if mime_type is None else mime_type.lower().encode("latin-1")
+
 
 class File(
     IODescriptor[FileType], descriptor_id="bentoml.io.File", proto_fields=("file",)
@@ -113,14 +260,19 @@ class File(
 
     """
 
+    _mime_type_bytes: bytes | None
+
     def __new__(
         cls, kind: FileKind = "binaryio", mime_type: str | None = None, **kwargs: t.Any
     ) -> File:
-        if kind == "binaryio":
-            res = super().__new__(BytesIOFile, **kwargs)
-        else:
-            raise ValueError(f"invalid File kind '{kind}'")
-        res._mime_type = mime_type
+        try:
+            klass = _KIND_TO_CLS[kind]
+        except KeyError:
+            raise ValueError(f"invalid File kind '{kind}'") from None
+        res = super().__new__(klass, **kwargs)
+        # interned, so descriptors declaring the same MIME type share one string
+        res._mime_type = None if mime_type is None else sys.intern(mime_type)
+        res._mime_type_bytes = _encode_mime_type(mime_type)
         return res
 
     def _from_sample(self, sample: FileType | str) -> FileType:
@@ -165,6 +317,7 @@ class File(
             p = resolve_user_filepath(sample, ctx=None)
             mime = mimetypes.guess_type(p)[0]
             self._mime_type = mime
+            self._mime_type_bytes = _encode_mime_type(mime)
             with open(p, "rb") as f:
                 sample = FileLike[bytes](f, "<sample>")
         return sample
@@ -210,36 +363,42 @@ class File(
         }
 
     async def to_http_response(self, obj: FileType, ctx: Context | None = None):
-        if isinstance(obj, bytes):
-            body = obj
-        else:
-            body = obj.read()
-
         if ctx is not None:
-            res = Response(
-                body,
-                headers=ctx.response.metadata,  # type: ignore (bad starlette types)
-                status_code=ctx.response.status_code,
+            headers = ctx.response.metadata
+            status_code = ctx.response.status_code
+        else:
+            headers = {
+                "content-type": (
+                    self._mime_type if self._mime_type else "application/octet-stream"
+                )
+            }
+            status_code = 200
+
+        size = None if isinstance(obj, bytes) else _regular_file_size(obj)
+        if size is not None:
+            # Files on disk are streamed instead of being read into memory.
+            res = FileDescriptorResponse(
+                obj,
+                size,
+                headers=headers,  # type: ignore (bad starlette types)
+                status_code=status_code,
             )
-            set_cookies(res, ctx.response.cookies)
         else:
+            body = obj if isinstance(obj, bytes) else _read_all(obj)
             res = Response(
                 body,
-                headers={
-                    "content-type": (
-                        self._mime_type
-                        if self._mime_type
-                        else "application/octet-stream"
-                    )
-                },
+                headers=headers,  # type: ignore (bad starlette types)
+                status_code=status_code,
             )
+        if ctx is not None:
+            set_cookies(res, ctx.response.cookies)
         return res
 
     async def to_proto(self, obj: FileType) -> pb.File:
         if isinstance(obj, bytes):
             body = obj
         else:
-            body = obj.read()
+            body = _read_all(obj)
 
         return pb.File(
             kind=(
@@ -254,7 +413,7 @@ class File(
         if isinstance(obj, bytes):
             body = obj
         else:
-            body = obj.read()
+            body = _read_all(obj)
 
         try:
             kind = mimetype_to_filetype_pb_map()[
@@ -289,30 +448,46 @@ class BytesIOFile(File, descriptor_id=None):
         }
 
     async def from_http_request(self, request: Request) -> FileLike[bytes]:
-        content_type, _ = parse_options_header(request.headers["content-type"])
-        if content_type.decode("utf-8") == "multipart/form-data":
-            form = await request.form()
+        content_type = _parse_content_type(request.headers["content-type"])
+        if content_type == b"multipart/form-data":
             found_mimes: t.List[str] = []
-            val: t.Union[str, UploadFile]
-            for val in form.values():  # type: ignore
-                if isinstance(val, UploadFile):
-                    found_mimes.append(val.content_type)  # type: ignore (bad starlette types)
-                    if self._mime_type is None or val.content_type == self._mime_type:  # type: ignore (bad starlette types)
-                        res = FileLike[bytes](val.file, val.filename)  # type: ignore (bad starlette types)
-                        break
+
+            def accept(headers: Headers) -> bool:
+                # only decide on the part headers, so that the bodies of
+                # non-matching parts never have to be buffered
+                mime = headers.get("content-type")
+                found_mimes.append(str(mime))
+                if self._mime_type_bytes is None:
+                    return True
+                # compared like the Content-Type of a raw request body
+                return (
+                    mime is not None
+                    and _parse_content_type(mime) == self._mime_type_bytes
+                )
+
+            if getattr(request, "_form", None) is not None:
+                # already parsed, e.g. when this File is part of a Multipart descriptor
+                files = _iter_form_files(await request.form(), accept)
             else:
-                if len(found_mimes) == 0:
-                    raise BentoMLException("no File found in multipart form")
-                else:
-                    raise BentoMLException(
-                        f"The File IO descriptor requires input to be of Content-Type '{self._mime_type}', got files with content types {', '.join(found_mimes)}"
-                    )
-            return res  # type: ignore
-        if self.mime_type is None or content_type.decode("utf-8") == self._mime_type:
-            body = await request.body()
-            return FileLike[bytes](io.BytesIO(body), "<request body>")
+                files = iter_multipart_files(
+                    request.headers, request.stream(), accept=accept
+                )
+            try:
+                async for val in files:
+                    return FileLike[bytes](val.file, val.filename)  # type: ignore (bad starlette types)
+            except (MultiPartException, MultipartParseError):
+                raise BadInput("Invalid multipart requests") from None
+            finally:
+                await files.aclose()
+            if len(found_mimes) == 0:
+                raise BentoMLException("no File found in multipart form")
+            raise BentoMLException(
+                f"The File IO descriptor requires input to be of Content-Type '{self._mime_type}', got files with content types {', '.join(found_mimes)}"
+            )
+        if self._mime_type_bytes is None or content_type == self._mime_type_bytes:
+            return FileLike[bytes](await _spool_request_body(request), "<request body>")
         raise BentoMLException(
-            f"File should have Content-Type '{self._mime_type}' or 'multipart/form-data', got {content_type} instead"
+            f"File should have Content-Type '{self._mime_type}' or 'multipart/form-data', got {content_type.decode('latin-1')} instead"
         )
 
     async def from_proto(
@@ -355,6 +530,9 @@ class BytesIOFile(File, descriptor_id=None):
         return FileLike[bytes](io.BytesIO(content), "<content>")
 
 
+_KIND_TO_CLS["binaryio"] = BytesIOFile
+
+
 # v1alpha1 backward compatibility
 @lru_cache(maxsize=1)
 def filetype_pb_to_mimetype_map() -> dict[pb_v1alpha1.File.FileType.ValueType, str]:
@@ -0,0 +1,92 @@
+"""
+JSON encoding and decoding with orjson, producing the same results as the json module.
+
+orjson is used when it is installed, and the json module is used for the values orjson
+would handle differently: NaN and Infinity, which orjson writes as null and refuses
+to parse, integers outside of the 64-bit range, which orjson refuses to write and
+parses as floats, and numpy arrays orjson can't write from their raw buffer, such as
+ones in non-native byte order, which the json module writes through ``default``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import sys
+import typing as t
+
+from .lazy_loader import LazyLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if t.TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyLoader("np", globals(), "numpy")
+
+# Integers that don't fit in 64 bits have at least 19 digits. This also matches some
+# values orjson parses correctly, which only costs a slower parse.
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+
+
+def _has_non_finite_float(obj: t.Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind == "f" and not bool(np.isfinite(obj).all())
+    return False
+
+
+def _is_raw_array(arr: np.ndarray[t.Any, t.Any]) -> bool:
+    # orjson copies the raw buffer, it doesn't handle other byte orders or strides
+    return arr.dtype.isnative and arr.flags.c_contiguous and arr.dtype.kind in "biuf"
+
+
+def _has_non_raw_array(obj: t.Any) -> bool:
+    if isinstance(obj, dict):
+        return any(_has_non_raw_array(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_raw_array(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        return not _is_raw_array(obj)
+    return False
+
+
+def dumps(obj: t.Any, default: t.Callable[[t.Any], t.Any] | None = None) -> bytes:
+    """Serialize ``obj`` to JSON bytes. Numpy arrays are serialized natively by orjson."""
+    # without numpy loaded there can't be any arrays to check
+    if orjson is not None and not ("numpy" in sys.modules and _has_non_raw_array(obj)):
+        try:
+            data = orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits
+        else:
+            # null may be a NaN or Infinity that orjson couldn't write
+            if b"null" not in data or not _has_non_finite_float(obj):
+                return data
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def loads(data: str | bytes | bytearray) -> t.Any:
+    """Deserialize JSON ``data``. Raises ``json.JSONDecodeError`` on invalid input."""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+        if pattern.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN and Infinity
+    return json.loads(data)
@@ -10,6 +10,7 @@ from tempfile import SpooledTemporaryFile
 from urllib.parse import unquote_plus
 
 import multipart.multipart as multipart
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData
 from starlette.datastructures import Headers
 from starlette.datastructures import MutableHeaders
@@ -287,6 +288,137 @@ class MultiPartParser:
         return FormData(self.items)
 
 
+class _ScanState(Enum):
+    PREAMBLE = 1
+    DELIMITER = 2
+    HEADERS = 3
+    BODY = 4
+
+
+async def write_spooled(
+    file: SpooledTemporaryFile[bytes], data: bytes | bytearray | memoryview
+) -> None:
+    if file._rolled:  # type: ignore (private SpooledTemporaryFile attribute)
+        # don't block the event loop with disk writes
+        await run_in_threadpool(file.write, data)
+    else:
+        file.write(data)
+
+
+async def _write_buffer_prefix(
+    file: SpooledTemporaryFile[bytes], buf: bytearray, end: int
+) -> None:
+    # Write through a memoryview to avoid copying the slice. The views have to be
+    # released before ``buf`` is resized again.
+    with memoryview(buf) as view, view[:end] as data:
+        await write_spooled(file, data)
+
+
+async def iter_multipart_files(
+    headers: Headers,
+    stream: t.AsyncIterator[bytes],
+    *,
+    accept: t.Callable[[Headers], bool] | None = None,
+    max_file_size: int = MultiPartParser.max_file_size,
+    max_header_size: int = 16 * 1024,
+) -> t.AsyncGenerator[UploadFile, None]:
+    """
+    Incrementally scan a ``multipart/form-data`` body and yield each file part as soon
+    as it has been fully received. Parts without a filename are skipped.
+
+    Unlike :class:`MultiPartParser`, this doesn't collect the whole form, so callers can
+    stop reading the request as soon as they found the file they are looking for.
+    If ``accept`` is given, it is called with the headers of each file part before its
+    body is read; the bodies of rejected parts are skipped without being buffered.
+    Delimiters are located with :meth:`bytearray.find`, which runs CPython's C
+    Boyer-Moore-Horspool style search over a rolling buffer instead of scanning the
+    body byte by byte.
+    """
+    _, params = multipart.parse_options_header(headers["Content-Type"])
+    charset = params.get(b"charset", "utf-8")
+    if isinstance(charset, bytes):
+        charset = charset.decode("latin-1")
+    try:
+        boundary = bytes(params[b"boundary"])
+    except KeyError:
+        raise MultiPartException("Missing boundary in multipart.")
+
+    delimiter = b"\r\n--" + boundary
+    # The first delimiter is not preceded by a line break, prepend one so that
+    # all delimiters can be matched the same way.
+    buf = bytearray(b"\r\n")
+    state = _ScanState.PREAMBLE
+    part_headers: list[tuple[bytes, bytes]] = []
+    filename: str | None = None
+    file: SpooledTemporaryFile[bytes] | None = None
+    chunks = stream.__aiter__()
+    try:
+        while True:
+            if state in (_ScanState.PREAMBLE, _ScanState.BODY):
+                idx = buf.find(delimiter)
+                if idx != -1:
+                    if file is not None:
+                        await _write_buffer_prefix(file, buf, idx)
+                        file.seek(0)
+                        upload = UploadFile(
+                            file=file,
+                            filename=filename,
+                            headers=Headers(raw=part_headers),
+                        )
+                        file = None
+                        yield upload
+                    del buf[: idx + len(delimiter)]
+                    state = _ScanState.DELIMITER
+                    continue
+                # keep enough bytes around to match a delimiter split across chunks
+                flush = len(buf) - len(delimiter) + 1
+                if flush > 0:
+                    if file is not None:
+                        await _write_buffer_prefix(file, buf, flush)
+                    del buf[:flush]
+            elif state == _ScanState.DELIMITER:
+                if buf[:2] == b"--":
+                    return
+                eol = buf.find(b"\r\n")
+                if eol != -1:
+                    del buf[: eol + 2]
+                    state = _ScanState.HEADERS
+                    continue
+                if len(buf) > max_header_size:
+                    raise MultiPartException("Malformed multipart delimiter.")
+            else:  # _ScanState.HEADERS
+                end = 0 if buf[:2] == b"\r\n" else buf.find(b"\r\n\r\n")
+                if end != -1:
+                    part_headers = []
+                    for line in bytes(buf[:end]).split(b"\r\n"):
+                        if not line:
+                            continue
+                        name, _, value = line.partition(b":")
+                        part_headers.append((name.strip().lower(), value.strip()))
+                    del buf[: end + (2 if end == 0 else 4)]
+                    disposition = dict(part_headers).get(b"content-disposition", b"")
+                    _, options = multipart.parse_options_header(disposition)
+                    if b"filename" in options and (
+                        accept is None or accept(Headers(raw=part_headers))
+                    ):
+                        filename = _user_safe_decode(
+                            bytes(options[b"filename"]), str(charset)
+                        )
+                        file = SpooledTemporaryFile(max_size=max_file_size)
+                    state = _ScanState.BODY
+                    continue
+                if len(buf) > max_header_size:
+                    raise MultiPartException("Multipart part headers are too large.")
+
+            try:
+                buf += await chunks.__anext__()
+            except StopAsyncIteration:
+                raise MultiPartException("Unexpected end of multipart body.")
+    finally:
+        if file is not None:
+            file.close()
+
+
 def file_body_to_message(f: UploadFile):
     async def res():
         return {
@@ -69,7 +69,12 @@ class LazyLoader(types.ModuleType):
     def __getattr__(self, item: t.Any) -> t.Any:
         if self._module is None:
             self._module = self._load()
-        return getattr(self._module, item)
+        value = getattr(self._module, item)
+        # Attributes that were not in the module's __dict__ at load time (submodules
+        # imported later, or ones provided by a module-level __getattr__) would
+        # otherwise go through this slow path on every lookup.
+        self.__dict__[item] = value
+        return value
 
     def __dir__(self) -> t.List[str]:
         if self._module is None:
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import io
 from typing import TYPE_CHECKING
+from typing import Any
 
 import pytest
+from starlette.requests import Request
 
+from bentoml._internal.io_descriptors.file import FileDescriptorResponse
 from bentoml.exceptions import BadInput
+from bentoml.exceptions import BentoMLException
 from bentoml.grpc.utils import import_generated_stubs
 from bentoml.io import File
 
@@ -67,3 +71,98 @@ async def test_to_proto() -> None:
     assert await File(mime_type="image/bmp").to_proto(io.BytesIO(b"asdf")) == pb.File(
         kind="image/bmp", content=b"asdf"
     )
+
+
+@pytest.mark.asyncio
+async def test_to_http_response_in_memory() -> None:
+    res = await File(mime_type="image/bmp").to_http_response(io.BytesIO(b"asdf"))
+    assert not isinstance(res, FileDescriptorResponse)
+    assert res.body == b"asdf"
+    assert res.headers["content-type"] == "image/bmp"
+
+
+@pytest.mark.asyncio
+async def test_to_http_response_streams_file_on_disk(bin_file: str) -> None:
+    with open(bin_file, "rb") as f:
+        res = await File().to_http_response(f)
+        assert isinstance(res, FileDescriptorResponse)
+        assert res.headers["content-length"] == "4"
+        assert res.headers["content-type"] == "application/octet-stream"
+        body = b"".join([chunk async for chunk in res.body_iterator])
+    assert body == b"\x810\x899"
+
+
+def make_request(body: bytes, content_type: str) -> Request:
+    messages = [
+        {"type": "http.request", "body": body[:3], "more_body": True},
+        {"type": "http.request", "body": body[3:], "more_body": False},
+    ]
+
+    async def receive() -> dict[str, Any]:
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", content_type.encode("latin-1"))],
+    }
+    return Request(scope, receive)
+
+
+@pytest.mark.asyncio
+async def test_from_http_request_body() -> None:
+    res = await File(mime_type="application/pdf").from_http_request(
+        make_request(b"%PDF-1.4 content", "application/pdf")
+    )
+    assert res.read() == b"%PDF-1.4 content"
+
+    with pytest.raises(BentoMLException):
+        await File(mime_type="application/pdf").from_http_request(
+            make_request(b"asdf", "image/jpeg")
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content_type", ["Image/JPEG", "image/jpeg", "Image/JPEG; q=1", "image/jpeg; q=1"]
+)
+async def test_from_http_request_content_type_case(content_type: str) -> None:
+    res = await File(mime_type="Image/JPEG").from_http_request(
+        make_request(b"jpeg data", content_type)
+    )
+    assert res.read() == b"jpeg data"
+
+
+@pytest.mark.asyncio
+async def test_from_http_request_multipart() -> None:
+    body = (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="meta"\r\n\r\n'
+        b'{"a": 1}\r\n'
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="img"; filename="a.jpg"\r\n'
+        b"Content-Type: image/jpeg\r\n\r\n"
+        b"jpeg data\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="doc"; filename="a.pdf"\r\n'
+        b"Content-Type: application/pdf\r\n\r\n"
+        b"pdf data\r\n"
+        b"--boundary--\r\n"
+    )
+    content_type = "multipart/form-data; boundary=boundary"
+    res = await File(mime_type="application/pdf").from_http_request(
+        make_request(body, content_type)
+    )
+    assert res.read() == b"pdf data"
+    res = await File().from_http_request(make_request(body, content_type))
+    assert res.read() == b"jpeg data"
+    res = await File(mime_type="Image/JPEG").from_http_request(
+        make_request(body, content_type)
+    )
+    assert res.read() == b"jpeg data"
+
+    with pytest.raises(BentoMLException) as exc_info:
+        await File(mime_type="image/png").from_http_request(
+            make_request(body, content_type)
+        )
+    assert "image/jpeg, application/pdf" in str(exc_info.value)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import math
+import typing as t
+
+import numpy as np
+import pytest
+
+from bentoml._internal.utils import fastjson
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": [1, 2.5, "x", None, True]},
+        {"big": 2**70, "neg": -(2**63) - 1, "max": 2**64 - 1},
+        [float("nan"), float("inf"), float("-inf"), None],
+        [],
+    ],
+)
+def test_dumps_loads_like_json(obj: t.Any):
+    data = fastjson.dumps(obj)
+    assert json.loads(data) == json.loads(json.dumps(obj))
+    for encoded in (data, data.decode(), json.dumps(obj), json.dumps(obj).encode()):
+        res = fastjson.loads(encoded)
+        assert json.dumps(res) == json.dumps(obj)
+
+
+def test_dumps_numpy():
+    assert json.loads(fastjson.dumps({"a": np.arange(3)})) == {"a": [0, 1, 2]}
+    for arr in (np.arange(3, dtype=">i4"), np.arange(3, dtype=">f4"), np.eye(2).T[0]):
+        data = fastjson.dumps({"x": arr}, default=lambda x: x.tolist())
+        assert json.loads(data) == {"x": arr.tolist()}
+    data = fastjson.dumps(np.array([np.nan, 1.0]), default=lambda x: x.tolist())
+    assert data == b"[NaN, 1.0]"
+    assert math.isnan(fastjson.loads(data)[0])
+
+
+def test_loads_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        fastjson.loads("not json")
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from starlette.datastructures import Headers
+
+from bentoml._internal.utils.formparser import MultiPartException
+from bentoml._internal.utils.formparser import iter_multipart_files
+
+BODY = (
+    b"preamble\r\n"
+    b"--b0undary\r\n"
+    b'Content-Disposition: form-data; name="meta"\r\n\r\n'
+    b'{"a": 1}\r\n'
+    b"--b0undary\r\n"
+    b'Content-Disposition: form-data; name="img"; filename="a.jpg"\r\n'
+    b"Content-Type: image/jpeg\r\n\r\n"
+    b"jpeg\r\n--b0und data\r\n"
+    b"--b0undary\r\n"
+    b'Content-Disposition: form-data; name="doc"; filename="a.pdf"\r\n'
+    b"Content-Type: application/pdf\r\n\r\n"
+    b"\r\n"
+    b"--b0undary--\r\n"
+    b"epilogue"
+)
+HEADERS = Headers({"Content-Type": "multipart/form-data; boundary=b0undary"})
+
+
+async def chunked(body: bytes, size: int) -> t.AsyncGenerator[bytes, None]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, len(BODY)])
+async def test_iter_multipart_files(chunk_size: int):
+    files = [f async for f in iter_multipart_files(HEADERS, chunked(BODY, chunk_size))]
+    assert [f.filename for f in files] == ["a.jpg", "a.pdf"]
+    assert [f.content_type for f in files] == ["image/jpeg", "application/pdf"]
+    assert files[0].file.read() == b"jpeg\r\n--b0und data"
+    assert files[1].file.read() == b""
+
+
+@pytest.mark.asyncio
+async def test_iter_multipart_files_stops_early():
+    chunks = chunked(BODY, 16)
+    async for f in iter_multipart_files(HEADERS, chunks):
+        assert f.filename == "a.jpg"
+        break
+    # the rest of the body is left unread
+    assert [c async for c in chunks]
+
+
+@pytest.mark.asyncio
+async def test_iter_multipart_files_invalid():
+    with pytest.raises(MultiPartException):
+        _ = [f async for f in iter_multipart_files(HEADERS, chunked(BODY[:-40], 8))]
+    with pytest.raises(MultiPartException):
+        headers = Headers({"Content-Type": "multipart/form-data"})
+        _ = [f async for f in iter_multipart_files(headers, chunked(BODY, 8))]
+
+
+@pytest.mark.asyncio
+async def test_iter_multipart_files_accept():
+    seen: list[str | None] = []
+
+    def accept(headers: Headers) -> bool:
+        seen.append(headers.get("content-type"))
+        return headers.get("content-type") == "application/pdf"
+
+    files = [
+        f async for f in iter_multipart_files(HEADERS, chunked(BODY, 5), accept=accept)
+    ]
+    assert seen == ["image/jpeg", "application/pdf"]
+    assert [f.filename for f in files] == ["a.pdf"]
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import pickle
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from _bentoml_impl.serde import JSONSerde
+from _bentoml_impl.serde import PickleSerde
+from _bentoml_sdk.io_models import IODescriptor
+
+TENSOR_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "arr": {"type": "tensor", "format": "numpy-array", "dtype": "float32"}
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.arange(6, dtype=np.float32).reshape(2, 3),
+        np.arange(6, dtype=np.float32).reshape(2, 3).T,  # not C-contiguous
+        np.arange(6, dtype=">f4").reshape(2, 3),  # big-endian
+        np.arange(6, dtype=">i4").reshape(2, 3),
+    ],
+)
+def test_json_serde_tensor(arr: np.ndarray):
+    serde = JSONSerde()
+    payload = serde.serialize({"arr": arr}, TENSOR_SCHEMA)
+    assert json.loads(b"".join(payload.data)) == {"arr": arr.tolist()}
+    res = serde.deserialize(payload, TENSOR_SCHEMA)
+    np.testing.assert_array_equal(res["arr"], arr)
+
+
+def test_tensor_schema_is_shared_between_values():
+    from _bentoml_impl.serde import _tensor_schema
+
+    schema = {"type": "tensor", "format": "numpy-array", "shape": [2, 3]}
+    assert _tensor_schema(schema) is _tensor_schema(dict(schema, shape=[2, 3]))
+    assert _tensor_schema(schema).shape == (2, 3)
+
+
+@pytest.mark.parametrize("fmt", ["numpy-array", "torch-tensor"])
+def test_json_serde_tensor_non_finite(fmt: str):
+    from _bentoml_sdk.validators import TensorSchema
+
+    if fmt == "torch-tensor":
+        torch = pytest.importorskip("torch")
+        arr = torch.tensor([np.nan, np.inf, 1.0])
+    else:
+        arr = np.array([np.nan, np.inf, 1.0])
+    schema = {
+        "type": "object",
+        "properties": {"arr": {"type": "tensor", "format": fmt}},
+    }
+    payload = JSONSerde().serialize({"arr": arr}, schema)
+    data = b"".join(payload.data)
+    assert b"NaN" in data and b"Infinity" in data
+    np.testing.assert_array_equal(json.loads(data)["arr"], [np.nan, np.inf, 1.0])
+    res = JSONSerde().deserialize(payload, schema)
+    np.testing.assert_array_equal(
+        TensorSchema(fmt).to_numpy(res["arr"]), [np.nan, np.inf, 1.0]
+    )
+
+
+def test_json_serde_non_finite_float_and_big_int():
+    payload = JSONSerde().serialize({"x": 2**70, "y": None}, {})
+    assert json.loads(b"".join(payload.data)) == {"x": 2**70, "y": None}
+    assert JSONSerde().deserialize(payload, {}) == {"x": 2**70, "y": None}
+    data = b"".join(JSONSerde().serialize({"x": float("nan"), "y": None}, {}).data)
+    assert b"NaN" in data
+
+
+def test_json_serde_root_model_tensor():
+    def func(_) -> npt.NDArray[np.float32]: ...
+
+    model_cls = IODescriptor.from_output(func)
+    arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+    payload = JSONSerde().serialize_model(model_cls(arr))
+    assert json.loads(b"".join(payload.data)) == arr.tolist()
+    res = JSONSerde().deserialize_model(payload, model_cls)
+    np.testing.assert_array_equal(res.root, arr)
+
+    # sent by clients that encode with the json module
+    res = model_cls.model_validate_json(b"[NaN, 1.0]")
+    np.testing.assert_array_equal(res.root, np.array([np.nan, 1.0]))
+
+
+def test_json_serde_root_model_big_int():
+    def func(_) -> int: ...
+
+    model_cls = IODescriptor.from_output(func)
+    payload = JSONSerde().serialize_model(model_cls(2**70))
+    assert b"".join(payload.data) == str(2**70).encode()
+    assert JSONSerde().deserialize_model(payload, model_cls).root == 2**70
+
+
+def test_pickle_serde_tensor():
+    serde = PickleSerde()
+    arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+    res = serde.deserialize(serde.serialize({"arr": arr}, TENSOR_SCHEMA), TENSOR_SCHEMA)
+    np.testing.assert_array_equal(res["arr"], arr)
+
+
+def test_torch_tensor_to_numpy():
+    torch = pytest.importorskip("torch")
+    from _bentoml_sdk.validators import TensorSchema
+
+    schema = TensorSchema("torch-tensor")
+    res = schema.to_numpy(torch.ones(2, requires_grad=True))
+    np.testing.assert_array_equal(res, np.ones(2))
+    assert schema.to_numpy(torch.ones(2, dtype=torch.float16)).dtype == np.float16
+    assert schema.to_numpy(torch.ones(2, dtype=torch.bfloat16)).dtype == np.float32
+
+
+@pytest.mark.parametrize("orient", ["records", "columns"])
+def test_json_serde_dataframe(orient: str):
+    pd = pytest.importorskip("pandas")
+    schema = {
+        "type": "dataframe",
+        "orient": orient,
+        "columns": ["a", "b", "c"],
+    }
+    serde = JSONSerde()
+    df = serde._decode([{"a": 1, "b": "x"}, {"a": 2, "c": 3.5}], schema)
+    pd.testing.assert_frame_equal(
+        df,
+        pd.DataFrame({"a": [1, 2], "b": ["x", None], "c": [None, 3.5]}),
+        check_dtype=False,
+    )
+    res = serde.deserialize(serde.serialize(df, schema), schema)
+    pd.testing.assert_frame_equal(res, df, check_dtype=False)
+
+    # values arrow can't hold, or converts to their storage values
+    for data in ([{"a": 2**70}], [{"a": 2**63}]):
+        df = serde._decode(data, {"type": "dataframe", "orient": orient})
+        assert df["a"].tolist() == [data[0]["a"]]
+    df = pd.DataFrame(
+        {
+            "p": pd.period_range("2020-01", periods=2, freq="M"),
+            "i": pd.interval_range(0, 2),
+        }
+    )
+    encoded = serde._encode(df, {"type": "dataframe", "orient": orient})
+    if orient == "records":
+        assert encoded == df.to_dict(orient="records")
+    else:
+        assert encoded == df.to_dict(orient="list")
+
+    # arrow turns NaN into null and timestamps into datetime.datetime
+    df = pd.DataFrame(
+        {
+            "f": [1.5, np.nan],
+            "t": pd.to_datetime(["2020-01-01", "2020-01-02"]),
+        }
+    )
+    encoded = serde._encode(df, {"type": "dataframe", "orient": orient})
+    expected = df.to_dict(orient="records" if orient == "records" else "list")
+    assert repr(encoded) == repr(expected)  # NaN != NaN
+    payload = serde.serialize(df[["f"]], {"type": "dataframe", "orient": orient})
+    assert b"NaN" in b"".join(payload.data)
+
+    # the {column: {index: value}} shape of DataFrame.to_dict()
+    df = serde._decode({"a": {"0": 1, "1": 2}}, {"type": "dataframe"})
+    pd.testing.assert_frame_equal(df, pd.DataFrame({"a": {"0": 1, "1": 2}}))
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"format": "numpy-array"},
+        {"format": "numpy-array", "dtype": "float32", "shape": (2,)},
+        {"format": "torch-tensor", "dtype": "float32"},
+        {"format": "torch-tensor", "shape": (2,)},
+    ],
+)
+def test_tensor_schema_pickle(schema: dict[str, t.Any]):
+    from _bentoml_sdk.validators import TensorSchema
+
+    if schema["format"] == "torch-tensor":
+        pytest.importorskip("torch")
+    tensor_schema = TensorSchema(**schema)
+    res = pickle.loads(pickle.dumps(tensor_schema))
+    assert res == tensor_schema
+    np.testing.assert_array_equal(
+        tensor_schema.to_numpy(res.validate([1, 2])), np.array([1, 2])
+    )
+
+
+def test_tensor_to_numpy_arrow_serialization():
+    from _bentoml_sdk.validators import TensorSchema
+    from _bentoml_sdk.validators import arrow_serialization
+
+    arr = np.arange(6, dtype=np.float32).reshape(2, 3)
+    with arrow_serialization():
+        res = TensorSchema("numpy-array").to_numpy(arr)
+        np.testing.assert_array_equal(res, np.arange(6, dtype=np.float32))
+        assert np.shares_memory(res, arr)
+        np.testing.assert_array_equal(
+            TensorSchema("numpy-array").to_numpy(arr.T), arr.T.flatten()
+        )
+        with arrow_serialization():
+            pass
+        # leaving a nested block restores the outer mode
+        assert TensorSchema("numpy-array").to_numpy(arr).ndim == 1
+    assert TensorSchema("numpy-array").to_numpy(arr) is arr